@@ -3,31 +3,81 @@
 YouTube Audio Downloader
 Downloads YouTube audio as MP3 to ~/Music folder.
 Splits files larger than 3GB into chunks named "title part N of M.mp3"
+Uses 'mutagen' to read MP3 durations if installed (pip install mutagen)
 
 Usage:
   downloadYT.py <youtube-url>              Download single video
+  downloadYT.py <url1> <url2> ...          Download several videos concurrently
   downloadYT.py --playlist <playlist-url>  Download playlist and combine into one file
 """
 
 import argparse
+import errno
+import itertools
 import json
+import mmap
+import os
+import queue
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    from mutagen import MutagenError
+    from mutagen.mp3 import MP3
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
 
 YTDLP = Path.home() / '.local' / 'bin' / 'yt-dlp'
 FFMPEG = Path.home() / '.local' / 'bin' / 'ffmpeg'
 FFPROBE = Path.home() / '.local' / 'bin' / 'ffprobe'
 OUTPUT_DIR = Path.home() / 'Music'
 MAX_SIZE_BYTES = 3 * 1024 * 1024 * 1024  # 3GB
+DEFAULT_JOBS = 4  # Concurrent video downloads in playlist mode
+COPY_BUFSIZE = 1024 * 1024  # Read size when kernel copy isn't available
+
+# MPEG audio Layer III bitrates in kbps, indexed by [is_mpeg1][bitrate_index]
+MP3_BITRATES = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates in Hz, indexed by [version_bits][rate_index] (3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5)
+MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+# String forms of the tool paths, passed to every subprocess call
+_YTDLP = str(YTDLP)
+_FFMPEG = str(FFMPEG)
+_FFPROBE = str(FFPROBE)
+
+# yt-dlp command prefix for downloading audio as best-quality MP3, built once
+YTDLP_MP3_ARGS = (
+    _YTDLP,
+    '--ffmpeg-location', _FFMPEG,
+    '-x',
+    '--audio-format', 'mp3',
+    '--audio-quality', '0',
+)
 
 
 def get_duration(file_path):
-    """Get audio duration in seconds using ffprobe."""
+    """Get audio duration in seconds using mutagen, or ffprobe if it isn't installed."""
+    if MUTAGEN_AVAILABLE:
+        try:
+            return MP3(str(file_path)).info.length
+        except MutagenError:
+            pass
+
     result = subprocess.run([
-        str(FFPROBE),
+        _FFPROBE,
         '-v', 'quiet',
         '-print_format', 'json',
         '-show_format',
@@ -41,42 +91,216 @@ def get_duration(file_path):
     return float(data['format']['duration'])
 
 
-def split_file(file_path):
-    """Split a large MP3 file into 3GB chunks."""
-    file_size = file_path.stat().st_size
-    num_chunks = (file_size // MAX_SIZE_BYTES) + 1
-    duration = get_duration(file_path)
+def _mp3_frame_info(b1, b2):
+    """
+    Decode the second and third bytes of an MPEG audio Layer III frame header.
 
-    if duration is None:
-        print(f"Error: Could not get duration of {file_path}")
+    Returns:
+        Tuple of (frame_length_bytes, frame_seconds), or None if not a valid header
+    """
+    if b1 & 0xE0 != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 3
+    layer = (b1 >> 1) & 3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = MP3_BITRATES[mpeg1][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    samples = 1152 if mpeg1 else 576
+    padding = (b2 >> 1) & 1
+
+    return samples // 8 * bitrate // sample_rate + padding, samples / sample_rate
+
+
+def find_mp3_split_points(file_path, split_times):
+    """
+    Walk the MP3 frame headers of a file and find where each split time falls.
+
+    Returns:
+        Tuple of (tag_end, audio_start, offsets), where tag_end is the size of
+        the leading ID3v2 tag, audio_start is the first audio frame (after any
+        Xing/Info header frame) and offsets are the byte offsets of the frames
+        starting each split time. None if the file can't be parsed as MP3.
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        pos = 0
+
+        # Skip the ID3v2 tag (its size is a 28-bit "synchsafe" integer)
+        if size >= 10 and mm[:3] == b'ID3':
+            pos = 10 + ((mm[6] & 0x7F) << 21 | (mm[7] & 0x7F) << 14 | (mm[8] & 0x7F) << 7 | (mm[9] & 0x7F))
+            if mm[5] & 0x10:
+                pos += 10
+        tag_end = pos
+
+        # Decoded headers, keyed by header bytes 2-3 (a file only uses a handful)
+        headers = {}
+        audio_start = None
+        offsets = []
+        targets = iter(split_times)
+        target = next(targets, None)
+        elapsed = 0.0
+
+        while target is not None and pos + 4 <= size:
+            info = None
+            if mm[pos] == 0xFF:
+                key = mm[pos + 1] << 8 | mm[pos + 2]
+                if key not in headers:
+                    headers[key] = _mp3_frame_info(mm[pos + 1], mm[pos + 2])
+                info = headers[key]
+
+            if info is None:
+                # Not a frame header, resync on the next 0xFF byte
+                pos = mm.find(b'\xff', pos + 1)
+                if pos == -1:
+                    break
+                continue
+
+            length, seconds = info
+
+            if audio_start is None:
+                # Require the next frame to line up before trusting the first sync
+                nxt = pos + length
+                if nxt + 3 <= size and (mm[nxt] != 0xFF or _mp3_frame_info(mm[nxt + 1], mm[nxt + 2]) is None):
+                    pos += 1
+                    continue
+                # A Xing/Info frame holds whole-file VBR data that would be wrong in a part
+                if mm.find(b'Xing', pos, pos + length) != -1 or mm.find(b'Info', pos, pos + length) != -1:
+                    audio_start = pos + length
+                    pos += length
+                    continue
+                audio_start = pos
+
+            if elapsed >= target:
+                offsets.append(pos)
+                target = next(targets, None)
+                continue
+
+            elapsed += seconds
+            pos += length
+
+    if audio_start is None or len(offsets) != len(split_times):
+        return None
+
+    return tag_end, audio_start, offsets
+
+
+def _copy_range(src_fd, dst_fd, offset, length):
+    """Copy length bytes from offset in src_fd to the current position of dst_fd."""
+    end = offset + length
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while offset < end:
+                sent = os.copy_file_range(src_fd, dst_fd, end - offset, offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+
+    if offset < end and hasattr(os, 'sendfile'):
+        try:
+            while offset < end:
+                sent = os.sendfile(dst_fd, src_fd, offset, end - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EINVAL):
+                raise
+
+    while offset < end:
+        data = os.pread(src_fd, min(COPY_BUFSIZE, end - offset), offset)
+        if not data:
+            break
+        os.write(dst_fd, data)
+        offset += len(data)
+
+
+def _split_by_byte_ranges(file_path, split_points, part_paths):
+    """Write each part as a frame-aligned byte range of the source MP3, with its ID3v2 tag."""
+    tag_end, audio_start, offsets = split_points
+    starts = [audio_start] + offsets
+    ends = offsets + [file_path.stat().st_size]
+
+    src_fd = os.open(file_path, os.O_RDONLY)
+    try:
+        tag = os.pread(src_fd, tag_end, 0)
+        for part_path, start, end in zip(part_paths, starts, ends):
+            print(f"  Creating: {part_path.name}")
+            dst_fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(dst_fd, tag)
+                _copy_range(src_fd, dst_fd, start, end - start)
+            finally:
+                os.close(dst_fd)
+    except OSError as e:
+        print(f"Error splitting file: {e}")
         return False
+    finally:
+        os.close(src_fd)
 
-    chunk_duration = duration / num_chunks
-    stem = file_path.stem
+    return True
 
-    print(f"Splitting into {num_chunks} parts ({chunk_duration:.1f}s each)...")
 
-    for i in range(num_chunks):
+def _split_with_ffmpeg(file_path, chunk_duration, part_paths):
+    """Split a file into parts of chunk_duration seconds by re-muxing with ffmpeg."""
+    for i, part_path in enumerate(part_paths):
         start_time = i * chunk_duration
-        part_name = f"{stem} part {i + 1} of {num_chunks}.mp3"
-        output_path = OUTPUT_DIR / part_name
 
-        print(f"  Creating: {part_name}")
+        print(f"  Creating: {part_path.name}")
 
         result = subprocess.run([
-            str(FFMPEG),
+            _FFMPEG,
             '-i', str(file_path),
             '-ss', str(start_time),
             '-t', str(chunk_duration),
             '-acodec', 'copy',
             '-y',
-            str(output_path)
+            str(part_path)
         ], capture_output=True)
 
         if result.returncode != 0:
             print(f"Error splitting file at part {i + 1}")
             return False
 
+    return True
+
+
+def split_file(file_path):
+    """Split a large MP3 file into 3GB chunks."""
+    file_size = file_path.stat().st_size
+    num_chunks = (file_size // MAX_SIZE_BYTES) + 1
+    duration = get_duration(file_path)
+
+    if duration is None:
+        print(f"Error: Could not get duration of {file_path}")
+        return False
+
+    chunk_duration = duration / num_chunks
+    stem = file_path.stem
+    part_paths = [OUTPUT_DIR / f"{stem} part {i + 1} of {num_chunks}.mp3" for i in range(num_chunks)]
+
+    print(f"Splitting into {num_chunks} parts ({chunk_duration:.1f}s each)...")
+
+    split_points = None
+    if file_path.suffix.lower() == '.mp3':
+        split_points = find_mp3_split_points(file_path, [i * chunk_duration for i in range(1, num_chunks)])
+
+    if split_points:
+        if not _split_by_byte_ranges(file_path, split_points, part_paths):
+            return False
+    elif not _split_with_ffmpeg(file_path, chunk_duration, part_paths):
+        return False
+
     # Remove original large file
     file_path.unlink()
     print(f"Removed original file: {file_path.name}")
@@ -102,7 +326,7 @@ def check_dependencies():
 
 
 def check_and_split(output_file):
-    """Check if file needs splitting and split if so."""
+    """Check if file needs splitting and split if so. Returns False if the split failed."""
     if output_file.exists() and output_file.stat().st_size > MAX_SIZE_BYTES:
         print()
         print(f"File is larger than 3GB ({output_file.stat().st_size / (1024**3):.1f}GB), splitting...")
@@ -110,10 +334,11 @@ def check_and_split(output_file):
             print("Split complete!")
         else:
             print("Split failed.")
-            sys.exit(1)
+            return False
+    return True
 
 
-def download_single(url):
+def download_single(url, limit_rate=None):
     """Download a single video as MP3."""
     print(f"Downloading audio from: {url}")
     print(f"Saving to: {OUTPUT_DIR}")
@@ -123,16 +348,16 @@ def download_single(url):
     filepath_file = OUTPUT_DIR / '.last_download.txt'
 
     # Download the file, saving the output path to a temp file
-    result = subprocess.run([
-        str(YTDLP),
-        '--ffmpeg-location', str(FFMPEG),
-        '-x',
-        '--audio-format', 'mp3',
-        '--audio-quality', '0',
+    cmd = [
+        *YTDLP_MP3_ARGS,
         '--print-to-file', 'after_move:filepath', str(filepath_file),
         '-o', output_template,
-        url
-    ])
+    ]
+    if limit_rate:
+        cmd += ['--limit-rate', limit_rate]
+    cmd.append(url)
+
+    result = subprocess.run(cmd)
 
     if result.returncode != 0:
         print()
@@ -150,29 +375,185 @@ def download_single(url):
     print()
     print(f"Download complete: {output_file.name}")
 
-    check_and_split(output_file)
+    if not check_and_split(output_file):
+        sys.exit(1)
+
 
+def _dl_video(url, limit_rate=None):
+    """
+    Download a single video as MP3 without printing yt-dlp's progress.
 
-def download_playlist(url, output_name=None):
-    """Download a playlist and combine all videos into a single MP3."""
-    print(f"Downloading playlist from: {url}")
+    Returns:
+        CompletedProcess from the yt-dlp run (stdout holds the file path)
+    """
+    cmd = [
+        *YTDLP_MP3_ARGS,
+        '--no-playlist',
+        '--no-warnings',
+        '--print', 'after_move:filepath',
+        '-o', str(OUTPUT_DIR / '%(title)s.%(ext)s'),
+    ]
+    if limit_rate:
+        cmd += ['--limit-rate', limit_rate]
+    cmd.append(url)
+
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+
+def download_many(urls, jobs=DEFAULT_JOBS, limit_rate=None):
+    """Download several videos as MP3, running up to jobs downloads at once."""
+    # The same URL given twice would download to the same file at once
+    urls = list(dict.fromkeys(urls))
+
+    print(f"Downloading audio from {len(urls)} videos ({jobs} at a time)")
+    print(f"Saving to: {OUTPUT_DIR}")
     print()
 
-    # Get playlist info
-    print("Fetching playlist info...")
+    output_files = []
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_dl_video, url, limit_rate): url for url in urls}
+        for done, future in enumerate(as_completed(futures), 1):
+            url = futures[future]
+            result = future.result()
+            downloaded = result.stdout.strip().splitlines()
+            if result.returncode == 0 and downloaded:
+                output_file = Path(downloaded[-1])
+                print(f"  [{done}/{len(urls)}] Downloaded: {output_file.name}")
+                output_files.append((url, output_file))
+            else:
+                print(f"  [{done}/{len(urls)}] FAILED: {url}")
+                failures.append((url, result.stderr.strip()))
+
+    for url, output_file in output_files:
+        if not check_and_split(output_file):
+            failures.append((url, f"could not split {output_file.name}"))
+
+    if failures:
+        print()
+        print(f"{len(failures)} download(s) failed:")
+        for url, err in failures:
+            print(f"  - {url}: {err.splitlines()[-1] if err else 'unknown error'}")
+        sys.exit(1)
+
+
+def get_playlist_entries(url):
+    """
+    Get a playlist's title and video indices without downloading anything.
+
+    Returns:
+        Tuple of (playlist_title, list of playlist indices), or None on failure
+    """
     result = subprocess.run([
-        str(YTDLP),
+        _YTDLP,
         '--flat-playlist',
-        '--print', '%(playlist_title)s',
-        '--playlist-items', '1',
+        '--print', '%(playlist_index)s %(playlist_title)s',
         url
     ], capture_output=True, text=True)
 
     if result.returncode != 0:
+        return None
+
+    title = None
+    indices = []
+    for line in result.stdout.splitlines():
+        index, _, playlist_title = line.strip().partition(' ')
+        if index.isdigit():
+            indices.append(int(index))
+            if title is None:
+                title = playlist_title
+
+    if not indices:
+        return None
+
+    return title, indices
+
+
+def _dl_batch(url, indices, raw_path, work_queue, counter, total, limit_rate=None):
+    """
+    Download a batch of playlist videos into raw_path, queueing each for conversion.
+
+    Returns:
+        Tuple of (set of downloaded playlist indices, list of yt-dlp error lines)
+    """
+    output_template = str(raw_path / '%(playlist_index)03d-%(title)s.%(ext)s')
+
+    cmd = [
+        _YTDLP,
+        '--ffmpeg-location', _FFMPEG,
+        '-f', 'bestaudio/best',
+        '--yes-playlist',
+        '--playlist-items', ','.join(str(index) for index in indices),
+        '--no-warnings',
+        '--print', 'after_move:filepath',
+        '-o', output_template,
+    ]
+    if limit_rate:
+        cmd += ['--limit-rate', limit_rate]
+    cmd.append(url)
+
+    downloaded = set()
+    errors = []
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+        for line in proc.stdout:
+            line = line.strip()
+            raw_file = Path(line)
+            index = raw_file.name.partition('-')[0]
+            if raw_file.parent == raw_path and index.isdigit() and raw_file.exists():
+                index = int(index)
+                downloaded.add(index)
+                print(f"  [{next(counter)}/{total}] Downloaded video {index}")
+                work_queue.put((index, raw_file))
+            elif line.startswith('ERROR:'):
+                errors.append(line)
+
+    return downloaded, errors
+
+
+def _transcode_worker(work_queue, output_dir, failures):
+    """Convert queued downloads to MP3 until a None sentinel; failures go to failures."""
+    while True:
+        item = work_queue.get()
+        if item is None:
+            return
+
+        index, raw_file = item
+        mp3_file = output_dir / f"{raw_file.stem}.mp3"
+
+        # Same encoder settings as yt-dlp's '-x --audio-quality 0'
+        result = subprocess.run([
+            _FFMPEG,
+            '-i', str(raw_file),
+            '-vn',
+            '-c:a', 'libmp3lame',
+            '-q:a', '0',
+            '-y',
+            str(mp3_file)
+        ], capture_output=True, text=True)
+
+        if result.returncode == 0:
+            print(f"  Converted video {index}")
+            raw_file.unlink()
+        else:
+            print(f"  FAILED to convert video {index}")
+            failures.append((index, result.stderr.strip()))
+
+
+def download_playlist(url, output_name=None, jobs=DEFAULT_JOBS, limit_rate=None):
+    """Download a playlist and combine all videos into a single MP3."""
+    print(f"Downloading playlist from: {url}")
+    print()
+
+    # Get playlist info and the videos in it, so each can be downloaded separately
+    print("Fetching playlist info...")
+    playlist = get_playlist_entries(url)
+    if not playlist:
         print("Error: Could not get playlist info")
         sys.exit(1)
 
-    playlist_title = result.stdout.strip()
+    playlist_title, indices = playlist
     if output_name:
         final_name = output_name
     else:
@@ -186,23 +567,55 @@ def download_playlist(url, output_name=None):
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Download all videos with numbered prefixes
-        print("Downloading playlist videos...")
-        output_template = str(temp_path / '%(playlist_index)03d-%(title)s.%(ext)s')
-
-        result = subprocess.run([
-            str(YTDLP),
-            '--ffmpeg-location', str(FFMPEG),
-            '-x',
-            '--audio-format', 'mp3',
-            '--audio-quality', '0',
-            '-o', output_template,
-            url
-        ])
-
-        if result.returncode != 0:
+        raw_path = temp_path / 'raw'
+        raw_path.mkdir()
+
+        # Download videos concurrently, each with a numbered prefix. Finished
+        # downloads are queued for MP3 conversion so encoding overlaps with
+        # the downloads still in progress.
+        print(f"Downloading {len(indices)} playlist videos ({jobs} at a time)...")
+        failures = []
+        work_queue = queue.Queue()
+        num_transcoders = os.cpu_count() or 2
+
+        transcoders = [
+            threading.Thread(target=_transcode_worker, args=(work_queue, temp_path, failures))
+            for _ in range(num_transcoders)
+        ]
+        for thread in transcoders:
+            thread.start()
+
+        # Each worker gets every jobs-th video so early videos finish first
+        batches = [indices[i::jobs] for i in range(min(jobs, len(indices)))]
+        counter = itertools.count(1)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                futures = {
+                    executor.submit(_dl_batch, url, batch, raw_path, work_queue, counter,
+                                    len(indices), limit_rate): batch
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    downloaded, errors = future.result()
+                    for index in futures[future]:
+                        if index not in downloaded:
+                            print(f"  FAILED video {index}")
+                            failures.append((index, errors[-1] if errors else ''))
+        finally:
+            # One sentinel per transcoder signals that no more work is
+            # coming; sent even if a download failed or was interrupted, so
+            # the transcoder threads always exit
+            for _ in transcoders:
+                work_queue.put(None)
+            for thread in transcoders:
+                thread.join()
+
+        if failures:
             print()
             print("Download failed.")
+            for index, err in sorted(failures):
+                print(f"  - video {index}: {err.splitlines()[-1] if err else 'unknown error'}")
             sys.exit(1)
 
         # Get all downloaded MP3s in order
@@ -227,7 +640,7 @@ def download_playlist(url, output_name=None):
         output_file = OUTPUT_DIR / f"{final_name}.mp3"
 
         result = subprocess.run([
-            str(FFMPEG),
+            _FFMPEG,
             '-f', 'concat',
             '-safe', '0',
             '-i', str(concat_file),
@@ -245,7 +658,8 @@ def download_playlist(url, output_name=None):
     print(f"Combined into: {output_file.name}")
     print(f"Size: {output_file.stat().st_size / (1024**3):.2f} GB")
 
-    check_and_split(output_file)
+    if not check_and_split(output_file):
+        sys.exit(1)
 
 
 def main():
@@ -255,26 +669,42 @@ def main():
         epilog='''
 Examples:
   %(prog)s 'https://www.youtube.com/watch?v=VIDEO_ID'
+  %(prog)s 'URL1' 'URL2' 'URL3'
   %(prog)s --playlist 'https://www.youtube.com/playlist?list=PLAYLIST_ID'
   %(prog)s --playlist 'URL' --name 'My Audiobook'
+  %(prog)s --playlist --jobs 8 'URL'
 '''
     )
-    parser.add_argument('url', help='YouTube URL')
+    parser.add_argument('urls', nargs='+', metavar='url',
+                        help='YouTube URL (several may be given, except in playlist mode)')
     parser.add_argument('--playlist', '-p', action='store_true',
                         help='Download entire playlist and combine into one file')
     parser.add_argument('--name', '-n', type=str,
                         help='Output filename (without extension) for playlist mode')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS,
+                        help=f'Number of videos to download at once (default: {DEFAULT_JOBS}). '
+                             'Use 1 if YouTube starts returning HTTP 429 errors')
+    parser.add_argument('--limit-rate', type=str,
+                        help='Maximum download rate per video, e.g. 2M (passed to yt-dlp)')
 
     args = parser.parse_args()
 
-    url = args.url.replace('\\', '')
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    if args.playlist and len(args.urls) > 1:
+        parser.error('--playlist takes a single URL')
+
+    urls = [url.replace('\\', '') for url in args.urls]
 
     check_dependencies()
 
     if args.playlist:
-        download_playlist(url, args.name)
+        download_playlist(urls[0], args.name, args.jobs, args.limit_rate)
+    elif len(urls) > 1:
+        download_many(urls, args.jobs, args.limit_rate)
     else:
-        download_single(url)
+        download_single(urls[0], args.limit_rate)
 
 
 if __name__ == '__main__':
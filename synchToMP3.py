@@ -6,6 +6,8 @@ Sync MP3 files from ~/Music to Innioasis Y1 MP3 player.
 - Copies MP3s from ~/Music/Audiobooks to device /Audiobooks
 - Removes MP3s from device that aren't in source
 - Does not create or modify folders
+- Finds the device under /media (set Y1_MOUNT to give its mount point)
+- Copies several files at once (--jobs N, default 4; 1 copies one at a time)
 - Shows progress bar if 'rich' library is installed (pip install rich)
 
 TODO:
@@ -14,68 +16,168 @@ TODO:
 - Add verbose/quiet flags
 """
 
+import argparse
+import errno
+import fcntl
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
-    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, TransferSpeedColumn
+    from rich.progress import (Progress, BarColumn, DownloadColumn, TextColumn,
+                               TimeRemainingColumn, TransferSpeedColumn)
     from rich.console import Console
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
 
 
+# Number of stat() calls kept in flight when scanning the device
+STAT_WORKERS = 8
+
+# Default number of files copied to the device at once
+DEFAULT_JOBS = 4
+
+# Y1 identifier directory, relative to the device root
+Y1_MARKER = os.path.join('Android', 'data', 'com.innioasis.y1')
+
+# Environment variable naming the device mount point, skipping the search
+DEVICE_ENV_VAR = 'Y1_MOUNT'
+
+# Wallpaper files found in the root of a Y1 that has a Themes folder
+Y1_WALLPAPERS = ('globalWallpaper.jpg', 'UsbBackground.jpg', 'desktopWallpaper.jpg')
+
+# Block size for userspace copies when the kernel can't copy for us
+COPY_BUFSIZE = 1024 * 1024
+
+# Status lines buffered before they are written to the terminal
+OUTPUT_BATCH = 64
+
+# Space left unused on the device when deciding whether a copy still fits,
+# to cover the directory entries of the new files
+FREE_SPACE_MARGIN = 8 * 1024 * 1024
+
+# ioctl request to clone a file's extents (reflink) on btrfs/XFS
+FICLONE = 0x40049409
+
+# Largest single copy_file_range/sendfile call (16 MiB), so each call
+# returns promptly even for long audiobooks
+KERNEL_COPY_CHUNK = 1 << 24
+
+# Errors meaning a kernel copy call isn't usable for this pair of files
+_KERNEL_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+# FAT stores modification times with 2 second resolution
+MTIME_TOLERANCE_NS = 2 * 1000 ** 3
+
+# Device subfolder that audiobooks are synced to
+AUDIOBOOKS = 'Audiobooks'
+
+# Every spelling of the .mp3 extension, for a case-insensitive endswith()
+# without lowercasing each name
+MP3_SUFFIXES = ('.mp3', '.mP3', '.Mp3', '.MP3')
+
 # Files to exclude from sync
-EXCLUDE_FILES = {
+EXCLUDE_FILES = frozenset({
     'synchToMP3.py',
     'downloadYT.py',
     'readme.md',
     'bashinstructions.md',
     'Claude.md',
     'yt-audio.sh',
-}
+})
 
 
-def find_y1_device():
+def _exists(path):
+    """Check that a path exists with a single stat() call."""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def is_y1_device(mount_point):
     """
-    Search for connected Innioasis Y1 device in /media.
+    Check whether a mount point is an Innioasis Y1.
 
     Checks for Y1-specific markers:
     - Android/data/com.innioasis.y1 directory
     - Themes folder with Y1 wallpaper files
 
+    A real Y1 is recognised by the first marker with a single stat() call.
+    """
+    # Check for Y1 identifier: Android/data/com.innioasis.y1
+    if _exists(os.path.join(mount_point, Y1_MARKER)):
+        return True
+
+    # Alternative check: Themes folder with Y1-specific files
+    if _exists(os.path.join(mount_point, 'Themes')):
+        return any(_exists(os.path.join(mount_point, f)) for f in Y1_WALLPAPERS)
+
+    return False
+
+
+def _device_cache_file():
+    """Path of the file remembering where the Y1 was last found."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'mp3-synch-rip', 'device')
+
+
+def _read_cached_device():
+    """Return the last mount point found, or None if nothing is cached."""
+    try:
+        with open(_device_cache_file()) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_cached_device(mount_point):
+    """Remember a mount point for next time. Failing to write is harmless."""
+    cache_file = _device_cache_file()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w') as f:
+            f.write(f"{mount_point}\n")
+    except OSError:
+        pass
+
+
+def find_y1_device():
+    """
+    Search for connected Innioasis Y1 device in /media.
+
+    The mount point in $Y1_MOUNT is tried first, then the one where the
+    device was last found. Both usually cost a single stat(). Only if
+    neither is a Y1 are the mounts under /media searched; they are checked
+    with is_y1_device() as they are listed, the search stops at the first
+    match, and the result is cached for the next run.
+
     Returns:
         Path to device mount point, or None if not found
     """
-    media_base = Path('/media')
-
-    if not media_base.exists():
+    for candidate in (os.environ.get(DEVICE_ENV_VAR), _read_cached_device()):
+        if candidate and is_y1_device(candidate):
+            return Path(candidate)
+
+    try:
+        with os.scandir('/media') as entries:
+            user_dirs = [entry.path for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return None
 
-    for user_dir in media_base.iterdir():
-        if not user_dir.is_dir():
-            continue
+    for user_dir in user_dirs:
         try:
-            mount_points = list(user_dir.iterdir())
+            with os.scandir(user_dir) as mount_points:
+                for mount_point in mount_points:
+                    if mount_point.is_dir() and is_y1_device(mount_point.path):
+                        _write_cached_device(mount_point.path)
+                        return Path(mount_point.path)
         except PermissionError:
             continue
-        for mount_point in mount_points:
-            if not mount_point.is_dir():
-                continue
-
-            # Check for Y1 identifier: Android/data/com.innioasis.y1
-            y1_marker = mount_point / 'Android' / 'data' / 'com.innioasis.y1'
-            if y1_marker.exists():
-                return mount_point
-
-            # Alternative check: Themes folder with Y1-specific files
-            themes_dir = mount_point / 'Themes'
-            if themes_dir.exists():
-                y1_files = ['globalWallpaper.jpg', 'UsbBackground.jpg', 'desktopWallpaper.jpg']
-                if any((mount_point / f).exists() for f in y1_files):
-                    return mount_point
 
     return None
 
@@ -90,141 +192,481 @@ def format_size(size_bytes):
 
 
 def get_device_free_space(device_path):
-    """Get free space on device in bytes."""
+    """Get free space on device in bytes, and its cluster (allocation unit) size."""
     stat = os.statvfs(device_path)
-    return stat.f_frsize * stat.f_bavail
+    return stat.f_frsize * stat.f_bavail, stat.f_frsize
+
+
+def size_on_disk(size, cluster_size):
+    """Round a file size up to the whole clusters it occupies."""
+    return -(-size // cluster_size) * cluster_size
+
+
+def same_file_version(device_entry, src_size, src_mtime):
+    """
+    Check whether a device file matches its source by size and mtime.
+
+    Copies keep the source mtime, so a changed mtime means the source was
+    edited (e.g. retagged) even if its size didn't change. FAT only stores
+    mtimes to 2 seconds, so smaller differences are ignored.
+    """
+    _, dev_size, dev_mtime = device_entry
+    return dev_size == src_size and abs(dev_mtime - src_mtime) < MTIME_TOLERANCE_NS
+
+
+def scan_mp3s(directory, missing_ok=False):
+    """
+    List the MP3 files directly inside a directory with one os.scandir pass.
+
+    The extension is checked on the raw entry name before anything else, and
+    the file type comes from the cached directory entry, so no extra stat()
+    is needed per file. Symlinked files are followed so they are not treated
+    as orphans.
+
+    Args:
+        directory: Directory to scan
+        missing_ok: Return an empty list instead of raising if the directory
+            doesn't exist (saves a separate exists() round trip)
+
+    Returns:
+        List of os.DirEntry objects for the MP3 files
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries
+                    if entry.name.endswith(MP3_SUFFIXES) and entry.is_file()]
+    except FileNotFoundError:
+        if missing_ok:
+            return []
+        raise
 
 
 def get_source_mp3s(music_dir):
     """
     Get MP3 files from source, mapped to their destination paths.
-    Returns dict: {dest_rel_path: source_absolute_path}
+    Returns dict: {dest_rel_path: (source_absolute_path, size_bytes, mtime_ns)}
+    Relative paths are POSIX strings such as 'Audiobooks/book.mp3'.
     """
     music_path = Path(music_dir)
     mp3s = {}
 
     # Get MP3s from root of Music folder (map to device root)
-    for item in music_path.iterdir():
-        if item.is_file() and item.suffix.lower() == '.mp3':
-            if item.name not in EXCLUDE_FILES:
-                # Destination is just the filename (device root)
-                mp3s[Path(item.name)] = item
+    for entry in scan_mp3s(music_path):
+        name = entry.name
+        if name not in EXCLUDE_FILES:
+            # Destination is just the filename (device root)
+            st = entry.stat()
+            mp3s[name] = (Path(entry.path), st.st_size, st.st_mtime_ns)
 
     # Get MP3s from Audiobooks subfolder (map to device /Audiobooks)
-    audiobooks_dir = music_path / 'Audiobooks'
-    if audiobooks_dir.exists():
-        for item in audiobooks_dir.iterdir():
-            if item.is_file() and item.suffix.lower() == '.mp3':
-                # Destination is Audiobooks/filename
-                mp3s[Path('Audiobooks') / item.name] = item
+    for entry in scan_mp3s(music_path / AUDIOBOOKS, missing_ok=True):
+        # Destination is Audiobooks/filename
+        st = entry.stat()
+        mp3s[f'{AUDIOBOOKS}/{entry.name}'] = (Path(entry.path), st.st_size, st.st_mtime_ns)
 
     return mp3s
 
 
-def get_device_mp3s(device_path):
+def scan_device_mp3s(device_path):
     """
-    Get MP3 files currently on device (root and Audiobooks only).
-    Returns dict: {rel_path: absolute_path}
+    List the MP3 files currently on device (root and Audiobooks only).
+
+    Only the directories are read; no file is stat()ed, so this is cheap
+    even on a slow device. Names alone are enough to find new and orphaned
+    files, and get_device_mp3s() stats just the ones that need comparing.
+
+    Returns dict: {rel_path: os.DirEntry}
+    Relative paths are POSIX strings such as 'Audiobooks/book.mp3'.
     """
     device = Path(device_path)
-    mp3s = {}
 
-    # Get MP3s from device root
-    for item in device.iterdir():
-        if item.is_file() and item.suffix.lower() == '.mp3':
-            mp3s[Path(item.name)] = item
+    # Get MP3s from device root and the device Audiobooks folder
+    entries = {entry.name: entry for entry in scan_mp3s(device)}
+    entries.update((f'{AUDIOBOOKS}/{entry.name}', entry)
+                   for entry in scan_mp3s(device / AUDIOBOOKS, missing_ok=True))
+    return entries
 
-    # Get MP3s from device Audiobooks folder
-    audiobooks_dir = device / 'Audiobooks'
-    if audiobooks_dir.exists():
-        for item in audiobooks_dir.iterdir():
-            if item.is_file() and item.suffix.lower() == '.mp3':
-                mp3s[Path('Audiobooks') / item.name] = item
 
-    return mp3s
+def get_device_mp3s(device_entries, rel_paths):
+    """
+    Stat the device files named in rel_paths.
+
+    Args:
+        device_entries: Dict from scan_device_mp3s()
+        rel_paths: Relative paths to look up (all must be in device_entries)
+
+    Returns dict: {rel_path: (absolute_path, size_bytes, mtime_ns)}
+    """
+    entries = [(rel, device_entries[rel]) for rel in rel_paths]
+    stats = batch_stat([entry for _, entry in entries])
+    return {rel: (Path(entry.path), st.st_size, st.st_mtime_ns)
+            for (rel, entry), st in zip(entries, stats)}
+
+
+def batch_stat(entries, max_workers=STAT_WORKERS):
+    """
+    Stat many directory entries with several requests in flight at once.
+
+    On slow USB/MTP mounts each stat() is a round trip to the device, so
+    issuing them concurrently hides most of the latency.
+
+    Args:
+        entries: List of os.DirEntry objects
+
+    Returns:
+        List of os.stat_result, in the same order as entries
+    """
+    if len(entries) < 2:
+        return [entry.stat() for entry in entries]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(os.DirEntry.stat, entries))
+
+
+class OutputBuffer:
+    """
+    Collect per-file status lines and write them out in batches.
+
+    Lines are held until OUTPUT_BATCH of them have built up, or until
+    flush() is called. A rich console gets each batch as one print() of the
+    joined markup lines, so the progress bar redraws once per batch rather
+    than once per file; otherwise the plain lines go out in a single
+    writelines() call.
+    """
+
+    def __init__(self, console=None):
+        self.console = console
+        self.lines = []
+
+    def __call__(self, msg, plain_msg=None):
+        if self.console is not None:
+            self.lines.append(msg)
+        else:
+            self.lines.append((plain_msg if plain_msg else msg) + '\n')
+        if len(self.lines) >= OUTPUT_BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self.lines:
+            return
+        if self.console is not None:
+            self.console.print('\n'.join(self.lines))
+        else:
+            sys.stdout.writelines(self.lines)
+            sys.stdout.flush()
+        self.lines.clear()
+
+
+def _fast_copy(src, dst):
+    """
+    Copy a file like shutil.copy2, moving the data inside the kernel.
+
+    The data goes through _kernel_copy (copy_file_range, then sendfile);
+    FAT devices usually reject copy_file_range with EXDEV, so sendfile does
+    the work there. A large-buffer userspace copy is the last resort. Both
+    files are dropped from the page cache once copied, and metadata (mtime,
+    mode) is copied afterwards with shutil.copystat.
+    """
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        size = os.fstat(src_fd).st_size
+
+        # The source is read front to back once; let the kernel read ahead
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        offset = _kernel_copy(src_fd, dst_fd, size)
+
+        if offset < size:
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            _buffered_copy(fsrc, fdst)
+
+        # Neither side will be read again soon; drop them from the page
+        # cache (the destination's dirty pages are queued for writeback)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+    shutil.copystat(src, dst)
+
+
+def _kernel_copy(src_fd, dst_fd, size):
+    """
+    Copy up to size bytes between two file descriptors without userspace
+    buffers.
 
+    Uses os.copy_file_range in KERNEL_COPY_CHUNK pieces, switching to
+    os.sendfile for whatever is left if the kernel refuses (EXDEV/ENOSYS
+    and friends, common when the destination is vfat).
 
-def sync_files(source_mp3s, device_path, progress=None, task=None, console=None):
+    Returns:
+        Number of bytes copied; anything short of size is left to the caller
     """
-    Copy MP3 files to device. Only copies to existing folders.
+    offset = 0
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while offset < size:
+                sent = os.copy_file_range(src_fd, dst_fd, min(size - offset, KERNEL_COPY_CHUNK),
+                                          offset, offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+
+    if offset < size and hasattr(os, 'sendfile'):
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, KERNEL_COPY_CHUNK))
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+
+    return offset
+
+
+def _buffered_copy(fsrc, fdst):
+    """
+    Copy the rest of fsrc to fdst through one reused COPY_BUFSIZE buffer.
+
+    Both files must be unbuffered (raw) file objects. The large block size
+    means far fewer, larger writes to FAT devices than shutil's 64 KiB
+    default, and reusing the buffer avoids an allocation per block.
+    """
+    buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
+    while True:
+        n = fsrc.readinto(buf)
+        if not n:
+            break
+        written = 0
+        while written < n:
+            written += fdst.write(view[written:n])
+
+
+def _reflink(src, dst):
+    """Clone src into dst without copying data. Raises OSError if unsupported."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def _copy_one(src_file, dest_file, same_fs=False, hardlink=False):
+    """
+    Copy a single file, removing any partial copy if it fails.
+
+    When source and destination are on the same filesystem the file is
+    reflinked if the filesystem supports it, or hard-linked if allowed,
+    so no data has to be moved.
+
+    Returns:
+        How the file was transferred: 'REFLINK', 'LINK' or 'COPY'
+    """
+    try:
+        if same_fs:
+            try:
+                _reflink(src_file, dest_file)
+                return 'REFLINK'
+            except OSError:
+                pass
+
+            if hardlink:
+                try:
+                    if os.path.exists(dest_file):
+                        os.unlink(dest_file)
+                    os.link(src_file, dest_file)
+                    return 'LINK'
+                except OSError:
+                    pass
+
+        _fast_copy(src_file, dest_file)
+        return 'COPY'
+    except Exception:
+        # Clean up partial file on error (there may be none)
+        try:
+            os.unlink(dest_file)
+        except OSError:
+            pass
+        raise
+
+
+def sync_files(plan, device_path, existing_dirs, progress=None, task=None, console=None,
+               jobs=DEFAULT_JOBS, hardlink=False, free_space=None, cluster_size=1):
+    """
+    Copy MP3 files to device according to the sync plan. Only copies to
+    existing folders.
+
+    Files are copied by a pool of worker threads so the next file's write
+    can start while the device is still committing the previous one.
+
+    If free_space is given, each queued copy is counted against it (less
+    FREE_SPACE_MARGIN), rounded up to whole clusters, before any copying
+    starts. Files are budgeted in plan order, and any that would no longer
+    fit are reported as errors up front instead of failing part-way
+    through with the device full.
 
     Args:
-        source_mp3s: Dict mapping destination relative paths to source Path objects
+        plan: List of (dest_rel, source Path, size, kind) tuples built by
+            main(), where kind is 'copy', 'update' or 'skip'
         device_path: Path to the mounted device
+        existing_dirs: Set of relative folder names that exist on the device ('' is the root)
         progress: Optional rich Progress instance for progress bar
-        task: Optional rich task ID for progress tracking
+        task: Optional rich task ID; advanced by the size of each file handled
         console: Optional rich Console for styled output
+        jobs: Number of files to copy at once
+        hardlink: Hard-link files instead of copying when on the same filesystem
+        free_space: Optional bytes available on the device for these copies
+        cluster_size: Device allocation unit in bytes; every file uses a
+            whole number of them
 
     Returns:
         Tuple of (copied_count, skipped_count, errors_list)
     """
-    device = Path(device_path)
-    use_rich = console is not None
-
-    def output(msg, plain_msg=None):
-        if use_rich:
-            console.print(msg)
-        else:
-            print(plain_msg if plain_msg else msg)
+    # Destination paths are built as plain strings; a Path per file is
+    # measurably slower with thousands of files
+    device_str = str(device_path)
+    output = OutputBuffer(console)
+    advance = progress.advance if progress and task is not None else None
 
     copied = 0
     skipped = 0
     errors = []
+    to_copy = []
 
-    for dest_rel, src_file in source_mp3s.items():
-        dest_file = device / dest_rel
+    # First pass: report skips and collect the files that need copying
+    for dest_rel, src_file, src_size, kind in plan:
+        if kind == 'skip':
+            output(f"  [yellow][SKIP][/yellow] {dest_rel} (already synced)",
+                   f"  [SKIP] {dest_rel} (already synced)")
+            skipped += 1
+            continue
 
         # Check if destination folder exists (don't create folders)
-        if not dest_file.parent.exists():
+        if dest_rel.rpartition('/')[0] not in existing_dirs:
             output(f"  [yellow][SKIP][/yellow] {dest_rel} (folder doesn't exist on device)",
                    f"  [SKIP] {dest_rel} (folder doesn't exist on device)")
             skipped += 1
-            if progress and task is not None:
-                progress.advance(task)
+            if advance:
+                advance(task, src_size)
             continue
 
-        # Check if file already exists and is same size
-        if dest_file.exists():
-            if dest_file.stat().st_size == src_file.stat().st_size:
-                output(f"  [yellow][SKIP][/yellow] {dest_rel} (already synced)",
-                       f"  [SKIP] {dest_rel} (already synced)")
-                skipped += 1
-                if progress and task is not None:
-                    progress.advance(task)
+        to_copy.append((dest_rel, src_file, os.path.join(device_str, dest_rel), src_size))
+
+    # Show all the skips at once before the (slow) copies start
+    output.flush()
+
+    if not to_copy:
+        return copied, skipped, errors
+
+    # Keep a running estimate of the space left instead of asking the
+    # device again; anything that won't fit is dropped from the queue
+    if free_space is not None:
+        remaining = free_space - FREE_SPACE_MARGIN
+        fits = []
+        for item in to_copy:
+            dest_rel, _, _, src_size = item
+            needed = size_on_disk(src_size, cluster_size)
+            if needed <= remaining:
+                remaining -= needed
+                fits.append(item)
                 continue
-
-        # Copy file
-        try:
-            output(f"  [green][COPY][/green] {dest_rel}",
-                   f"  [COPY] {dest_rel}")
-            shutil.copy2(src_file, dest_file)
+            output(f"  [red][ERROR][/red] {dest_rel}: not enough space on device",
+                   f"  [ERROR] {dest_rel}: not enough space on device")
+            errors.append((dest_rel, "not enough space on device"))
+            if advance:
+                advance(task, src_size)
+        output.flush()
+        to_copy = fits
+
+        if not to_copy:
+            return copied, skipped, errors
+
+    # Start the largest files first. With mixed sizes (audiobooks next to
+    # short tracks) this keeps one big copy from starting last and running
+    # alone on a single worker while the others sit idle.
+    to_copy.sort(key=lambda item: item[3], reverse=True)
+
+    # Second pass: copy files, reporting each as it finishes.
+    # Source folders are few, so look up each one's filesystem only once.
+    device_dev = os.stat(device_str).st_dev
+    folder_devs = {folder: os.stat(folder).st_dev for folder in {src.parent for _, src, _, _ in to_copy}}
+    work = [(dest_rel, src_file, dest_file, folder_devs[src_file.parent] == device_dev)
+            for dest_rel, src_file, dest_file, _ in to_copy]
+    sizes = {dest_rel: src_size for dest_rel, _, _, src_size in to_copy}
+
+    for dest_rel, method, error in _run_copies(work, jobs, hardlink):
+        if error is None:
+            output(f"  [green][{method}][/green] {dest_rel}",
+                   f"  [{method}] {dest_rel}")
             copied += 1
-        except Exception as e:
-            output(f"  [red][ERROR][/red] {dest_rel}: {e}",
-                   f"  [ERROR] {dest_rel}: {e}")
-            errors.append((dest_rel, str(e)))
-            # Clean up partial file on error
-            if dest_file.exists():
-                try:
-                    dest_file.unlink()
-                except:
-                    pass
+        else:
+            output(f"  [red][ERROR][/red] {dest_rel}: {error}",
+                   f"  [ERROR] {dest_rel}: {error}")
+            errors.append((dest_rel, str(error)))
 
-        if progress and task is not None:
-            progress.advance(task)
+        # Each copy takes a while, so report it as soon as it's done
+        output.flush()
+
+        if advance:
+            advance(task, sizes[dest_rel])
 
     return copied, skipped, errors
 
 
-def remove_orphans(source_mp3s, device_mp3s, progress=None, task=None, console=None):
+def _run_copies(work, jobs, hardlink=False):
+    """
+    Run the copies in work and yield (dest_rel, method, error) as each finishes.
+
+    Copies run on a pool of jobs worker threads; with jobs=1 they run one at
+    a time in the calling thread, for devices that are slower with
+    overlapping writes. Results are yielded in the caller's thread, so output
+    and progress updates need no locking.
+
+    Args:
+        work: List of (dest_rel, src_file, dest_file, same_fs) tuples
+        jobs: Number of files to copy at once
+        hardlink: Allow hard links when source and device share a filesystem
+    """
+    if jobs == 1:
+        for dest_rel, src_file, dest_file, same_fs in work:
+            try:
+                yield dest_rel, _copy_one(src_file, dest_file, same_fs, hardlink), None
+            except Exception as e:
+                yield dest_rel, None, e
+        return
+
+    # Managed by hand so an interrupt (Ctrl-C) cancels the copies that
+    # haven't started yet instead of waiting for the whole library
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        futures = {
+            executor.submit(_copy_one, src_file, dest_file, same_fs, hardlink): dest_rel
+            for dest_rel, src_file, dest_file, same_fs in work
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def remove_orphans(to_delete, device_path, console=None):
     """
     Remove MP3s from device that don't exist in source.
 
     Args:
-        source_mp3s: Dict of source MP3s (used to check what should exist)
-        device_mp3s: Dict mapping device relative paths to device Path objects
-        progress: Optional rich Progress instance for progress bar
-        task: Optional rich task ID for progress tracking
+        to_delete: Relative paths of the orphaned device files
+        device_path: Path to the mounted device
         console: Optional rich Console for styled output
 
     Returns:
@@ -232,35 +674,42 @@ def remove_orphans(source_mp3s, device_mp3s, progress=None, task=None, console=N
     """
     removed = 0
     errors = []
-    use_rich = console is not None
+    output = OutputBuffer(console)
 
-    def output(msg, plain_msg=None):
-        if use_rich:
-            console.print(msg)
-        else:
-            print(plain_msg if plain_msg else msg)
-
-    source_names = set(source_mp3s.keys())
+    device_str = str(device_path)
+    unlink = os.unlink
+    join = os.path.join
 
-    for dest_rel, device_file in device_mp3s.items():
-        if dest_rel not in source_names:
-            try:
-                output(f"  [red][DELETE][/red] {dest_rel}",
-                       f"  [DELETE] {dest_rel}")
-                device_file.unlink()
-                removed += 1
-            except Exception as e:
-                output(f"  [red][ERROR][/red] Could not delete {dest_rel}: {e}",
-                       f"  [ERROR] Could not delete {dest_rel}: {e}")
-                errors.append((dest_rel, str(e)))
-
-            if progress and task is not None:
-                progress.advance(task)
+    for dest_rel in to_delete:
+        try:
+            output(f"  [red][DELETE][/red] {dest_rel}",
+                   f"  [DELETE] {dest_rel}")
+            unlink(join(device_str, dest_rel))
+            removed += 1
+        except Exception as e:
+            output(f"  [red][ERROR][/red] Could not delete {dest_rel}: {e}",
+                   f"  [ERROR] Could not delete {dest_rel}: {e}")
+            errors.append((dest_rel, str(e)))
 
+    output.flush()
     return removed, errors
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Sync MP3 files from ~/Music to an Innioasis Y1')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS,
+                        help=f'Number of files to copy at once (default: {DEFAULT_JOBS}, '
+                             '1 copies one file at a time)')
+    parser.add_argument('--hardlink', action='store_true',
+                        help='Hard-link instead of copying when the device folder is on the same '
+                             'filesystem as ~/Music (e.g. a local test folder)')
+    parser.add_argument('--no-sync', action='store_true',
+                        help="Don't flush writes to the device when done (ejecting will flush them)")
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
     music_dir = Path.home() / 'Music'
 
     print("=" * 60)
@@ -281,36 +730,47 @@ def main():
     print()
 
     # Get device free space
-    free_space = get_device_free_space(device_path)
+    free_space, cluster_size = get_device_free_space(device_path)
     print(f"Device free space: {format_size(free_space)}")
     print()
 
     # Get source and device MP3s
+    # The local library and the device are independent (and the device
+    # side is mostly USB latency), so scan both at once
     print(f"Scanning {music_dir} for MP3 files...")
-    source_mp3s = get_source_mp3s(music_dir)
-    device_mp3s = get_device_mp3s(device_path)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(get_source_mp3s, music_dir)
+        device_future = executor.submit(scan_device_mp3s, device_path)
+        source_mp3s = source_future.result()
+        device_entries = device_future.result()
 
-    if not source_mp3s and not device_mp3s:
+    if not source_mp3s and not device_entries:
         print("No MP3 files to sync.")
         sys.exit(0)
 
-    # Determine what needs to be done
-    source_names = set(source_mp3s.keys())
-    device_names = set(device_mp3s.keys())
-
-    to_copy = []
-    to_update = []
-    to_skip = []
-    to_delete = list(device_names - source_names)
-
-    for dest_rel, src_file in source_mp3s.items():
-        dest_file = device_path / dest_rel
-        if dest_rel not in device_names:
-            to_copy.append(dest_rel)
-        elif dest_file.exists() and dest_file.stat().st_size != src_file.stat().st_size:
-            to_update.append(dest_rel)
+    # Only files on both sides need their device size and mtime; new and
+    # orphaned files are told apart by name alone
+    device_mp3s = get_device_mp3s(device_entries, source_mp3s.keys() & device_entries.keys())
+
+    # Classify every source file in one pass over the sizes cached by the
+    # scans: (rel_path, source_path, size, 'copy' | 'update' | 'skip')
+    plan = []
+    space_needed = 0
+    for dest_rel, (src_file, src_size, src_mtime) in sorted(source_mp3s.items()):
+        if dest_rel not in device_mp3s:
+            kind = 'copy'
+        elif not same_file_version(device_mp3s[dest_rel], src_size, src_mtime):
+            kind = 'update'
         else:
-            to_skip.append(dest_rel)
+            kind = 'skip'
+        plan.append((dest_rel, src_file, src_size, kind))
+        if kind != 'skip':
+            space_needed += size_on_disk(src_size, cluster_size)
+
+    to_copy = [(f, size) for f, _, size, kind in plan if kind == 'copy']
+    to_update = [f for f, _, _, kind in plan if kind == 'update']
+    to_skip_count = len(plan) - len(to_copy) - len(to_update)
+    to_delete = sorted(device_entries.keys() - source_mp3s.keys())
 
     # Show summary
     print(f"Found {len(source_mp3s)} source MP3(s)")
@@ -319,15 +779,14 @@ def main():
     print("-" * 40)
     if to_copy:
         print(f"  To copy:   {len(to_copy)} file(s)")
-        for f in to_copy:
-            size = format_size(source_mp3s[f].stat().st_size)
-            print(f"    + {f} ({size})")
+        for f, size in to_copy:
+            print(f"    + {f} ({format_size(size)})")
     if to_update:
         print(f"  To update: {len(to_update)} file(s)")
         for f in to_update:
             print(f"    ~ {f}")
-    if to_skip:
-        print(f"  Up to date: {len(to_skip)} file(s)")
+    if to_skip_count:
+        print(f"  Up to date: {to_skip_count} file(s)")
     if to_delete:
         print(f"  To delete: {len(to_delete)} file(s)")
         for f in to_delete:
@@ -339,8 +798,7 @@ def main():
         print("Everything is in sync!")
         sys.exit(0)
 
-    # Calculate space needed for new/updated files
-    space_needed = sum(source_mp3s[f].stat().st_size for f in to_copy + to_update)
+    # Warn if the new/updated files may not fit
     if space_needed > free_space:
         print(f"WARNING: May not have enough space!")
         print(f"  Need: {format_size(space_needed)}")
@@ -361,26 +819,43 @@ def main():
     total_removed = 0
     all_errors = []
 
-    # Calculate total operations for progress bar
-    total_ops = len(source_mp3s) + len(to_delete)
+    # Space the copies can use: updated files overwrite their old copies,
+    # so that space is freed as they go (orphans are only deleted after)
+    copy_space = free_space + sum(size_on_disk(device_mp3s[f][1], cluster_size)
+                                  for f in to_update)
+
+    # Folders present on the device (files are never copied into missing ones)
+    existing_dirs = {''}
+    if (device_path / AUDIOBOOKS).is_dir():
+        existing_dirs.add(AUDIOBOOKS)
 
-    if RICH_AVAILABLE:
+    # The progress bar counts bytes to copy, so big audiobooks weigh more
+    # than short tracks and the ETA stays meaningful. Deletes are quick and
+    # aren't tracked on the bar, so a delete-only sync shows no bar at all.
+    total_bytes = sum(size for _, _, size, kind in plan if kind != 'skip')
+
+    if RICH_AVAILABLE and total_bytes:
         console = Console()
         with Progress(
             TextColumn("[bold blue]{task.description}"),
             BarColumn(bar_width=40),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("({task.completed}/{task.total})"),
+            DownloadColumn(),
+            TransferSpeedColumn(),
             TimeRemainingColumn(),
             console=console,
             transient=False,
         ) as progress:
-            task = progress.add_task("Syncing...", total=total_ops)
+            task = progress.add_task("Syncing...", total=total_bytes)
 
             if to_copy or to_update:
                 console.print("Copying files...")
                 console.print("-" * 40)
-                copied, skipped, errors = sync_files(source_mp3s, device_path, progress, task, console)
+                copied, skipped, errors = sync_files(plan, device_path, existing_dirs,
+                                                     progress, task, console, jobs=args.jobs,
+                                                     hardlink=args.hardlink,
+                                                     free_space=copy_space,
+                                                     cluster_size=cluster_size)
                 total_copied = copied
                 total_skipped = skipped
                 all_errors.extend(errors)
@@ -390,20 +865,24 @@ def main():
             if to_delete:
                 console.print("Removing orphaned files...")
                 console.print("-" * 40)
-                removed, errors = remove_orphans(source_mp3s, device_mp3s, progress, task, console)
+                removed, errors = remove_orphans(to_delete, device_path, console=console)
                 total_removed = removed
                 all_errors.extend(errors)
                 console.print("-" * 40)
                 console.print()
     else:
-        # Fallback if rich is not installed
-        print("(Install 'rich' for progress bar: pip install rich)")
-        print()
+        # Fallback if rich is not installed (or there is nothing to copy)
+        if not RICH_AVAILABLE:
+            print("(Install 'rich' for progress bar: pip install rich)")
+            print()
 
         if to_copy or to_update:
             print("Copying files...")
             print("-" * 40)
-            copied, skipped, errors = sync_files(source_mp3s, device_path)
+            copied, skipped, errors = sync_files(plan, device_path, existing_dirs,
+                                                 jobs=args.jobs, hardlink=args.hardlink,
+                                                 free_space=copy_space,
+                                                 cluster_size=cluster_size)
             total_copied = copied
             total_skipped = skipped
             all_errors.extend(errors)
@@ -413,12 +892,19 @@ def main():
         if to_delete:
             print("Removing orphaned files...")
             print("-" * 40)
-            removed, errors = remove_orphans(source_mp3s, device_mp3s)
+            removed, errors = remove_orphans(to_delete, device_path)
             total_removed = removed
             all_errors.extend(errors)
             print("-" * 40)
             print()
 
+    # Wait once for the device's pending writeback to finish before
+    # telling the user it's safe to eject
+    if not args.no_sync and hasattr(os, 'sync'):
+        print("Flushing writes to device...")
+        os.sync()
+        print()
+
     # Summary
     print("Sync complete!")
     print(f"  Copied:  {total_copied}")